@@ -4,6 +4,7 @@ import (
 	"context"
 	"fmt"
 	"log"
+	"sync"
 	"time"
 
 	"awx-deployer/internal/config"
@@ -31,25 +32,48 @@ func main() {
 
 	log.Println("Starting AWX deployment...")
 
-	// Step 1: Install AWX Operator
+	manifestApplier := deploy.NewManifestApplier(k8sClient, cfg)
 	operatorInstaller := operator.NewOperatorInstaller(k8sClient, cfg)
-	if err := operatorInstaller.Install(ctx); err != nil {
-		log.Fatalf("Failed to install AWX operator: %v", err)
+
+	// Step 1: Create the namespace everything else lives in
+	if err := manifestApplier.ApplyNamespace(ctx); err != nil {
+		log.Fatalf("Failed to create namespace: %v", err)
 	}
 
-	// Step 2: Apply manifests
-	manifestApplier := deploy.NewManifestApplier(k8sClient, cfg)
-	if err := manifestApplier.Apply(ctx); err != nil {
-		log.Fatalf("Failed to apply manifests: %v", err)
+	// Step 2: Install AWX Operator and apply the supporting manifests concurrently;
+	// only the AWX instance itself depends on the operator
+	var wg sync.WaitGroup
+	var operatorErr, prerequisitesErr error
+	wg.Add(2)
+	go func() {
+		defer wg.Done()
+		operatorErr = operatorInstaller.Install(ctx)
+	}()
+	go func() {
+		defer wg.Done()
+		prerequisitesErr = manifestApplier.ApplyPrerequisites(ctx)
+	}()
+	wg.Wait()
+
+	if operatorErr != nil {
+		log.Fatalf("Failed to install AWX operator: %v", operatorErr)
+	}
+	if prerequisitesErr != nil {
+		log.Fatalf("Failed to apply manifests: %v", prerequisitesErr)
+	}
+
+	// Step 3: Apply AWX instance
+	if err := manifestApplier.ApplyInstance(ctx); err != nil {
+		log.Fatalf("Failed to apply AWX instance: %v", err)
 	}
 
-	// Step 3: Wait for deployment
+	// Step 4: Wait for deployment
 	deploymentWaiter := deploy.NewDeploymentWaiter(k8sClient, cfg)
 	if err := deploymentWaiter.WaitForReady(ctx, 15*time.Minute); err != nil {
 		log.Fatalf("Deployment failed to become ready: %v", err)
 	}
 
-	// Step 4: Verify deployment
+	// Step 5: Verify deployment
 	verifier := deploy.NewDeploymentVerifier(k8sClient, cfg)
 	if err := verifier.Verify(ctx); err != nil {
 		log.Fatalf("Deployment verification failed: %v", err)
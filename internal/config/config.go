@@ -98,6 +98,13 @@ func (c *Config) validate() error {
 	if c.KubeconfigPath == "" {
 		return fmt.Errorf("KUBECONFIG is required")
 	}
+	info, err := os.Stat(c.KubeconfigPath)
+	if err != nil {
+		return fmt.Errorf("kubeconfig file %s not found, please mount a valid kubeconfig: %v", c.KubeconfigPath, err)
+	}
+	if info.Size() == 0 {
+		return fmt.Errorf("kubeconfig file %s is empty", c.KubeconfigPath)
+	}
 	if c.AWXHostname == "" {
 		return fmt.Errorf("AWX_HOSTNAME is required")
 	}
@@ -4,14 +4,19 @@ import (
 	"context"
 	"fmt"
 	"log"
-	"os"
 	"path/filepath"
 	"sort"
+	"sync"
 
 	"awx-deployer/internal/config"
 	"awx-deployer/internal/k8s"
+
+	"k8s.io/apimachinery/pkg/apis/meta/v1/unstructured"
 )
 
+// operatorManifest is applied by the operator installer, not here
+const operatorManifest = "awx-operator.yaml"
+
 // ManifestApplier handles applying Kubernetes manifests
 type ManifestApplier struct {
 	k8sClient     *k8s.KubernetesClient
@@ -28,38 +33,97 @@ func NewManifestApplier(k8sClient *k8s.KubernetesClient, config *config.Config)
 	}
 }
 
-// Apply applies all AWX manifests from the manifests directory
-func (m *ManifestApplier) Apply(ctx context.Context) error {
-	log.Println("Applying AWX manifests from static YAML files...")
+// ApplyNamespace applies the AWX namespace
+func (m *ManifestApplier) ApplyNamespace(ctx context.Context) error {
+	return m.applyObject(ctx, namespaceObject(m.config))
+}
+
+// ApplyPrerequisites concurrently applies everything the AWX instance
+// depends on: the permissions job, storage class, volumes and secrets built
+// from the configuration, plus any additional static manifests. None of them
+// depend on each other, so their API round-trips can overlap.
+func (m *ManifestApplier) ApplyPrerequisites(ctx context.Context) error {
+	files, err := m.manifestFiles()
+	if err != nil {
+		return err
+	}
+
+	var manifests []string
+	for _, file := range files {
+		if filepath.Base(file) != operatorManifest {
+			manifests = append(manifests, file)
+		}
+	}
+	objects := prerequisiteObjects(m.config)
+
+	log.Printf("Applying %d prerequisite objects and %d manifests...", len(objects), len(manifests))
 
-	// Check if manifests directory exists
-	if _, err := os.Stat(m.manifestsPath); os.IsNotExist(err) {
-		return fmt.Errorf("manifests directory %s does not exist", m.manifestsPath)
+	errs := make(chan error, len(objects)+len(manifests))
+	var wg sync.WaitGroup
+	for _, obj := range objects {
+		wg.Add(1)
+		go func(obj *unstructured.Unstructured) {
+			defer wg.Done()
+			errs <- m.applyObject(ctx, obj)
+		}(obj)
 	}
+	for _, file := range manifests {
+		wg.Add(1)
+		go func(file string) {
+			defer wg.Done()
+			errs <- m.applyFile(ctx, file)
+		}(file)
+	}
+	wg.Wait()
+	close(errs)
 
-	// Read all YAML files from manifests directory
+	for err := range errs {
+		if err != nil {
+			return err
+		}
+	}
+
+	log.Println("All prerequisites applied successfully")
+	return nil
+}
+
+// ApplyInstance applies the AWX custom resource; the operator must be installed first
+func (m *ManifestApplier) ApplyInstance(ctx context.Context) error {
+	return m.applyObject(ctx, awxInstanceObject(m.config))
+}
+
+// manifestFiles returns the sorted YAML files in the manifests directory
+func (m *ManifestApplier) manifestFiles() ([]string, error) {
+	// Glob matches nothing for a missing directory, so that case is
+	// reported by the empty check below without a separate stat
 	files, err := filepath.Glob(filepath.Join(m.manifestsPath, "*.yaml"))
 	if err != nil {
-		return fmt.Errorf("failed to read manifest files: %v", err)
+		return nil, fmt.Errorf("failed to read manifest files: %v", err)
 	}
 
 	if len(files) == 0 {
-		return fmt.Errorf("no YAML manifest files found in %s", m.manifestsPath)
+		return nil, fmt.Errorf("no YAML manifest files found in %s (does the directory exist?)", m.manifestsPath)
 	}
 
-	// Sort files to ensure they are applied in order
+	// Sort files so log output is stable
 	sort.Strings(files)
+	return files, nil
+}
 
-	log.Printf("Found %d manifest files to apply", len(files))
-
-	// Apply each manifest file
-	for _, file := range files {
-		log.Printf("Applying manifest: %s", filepath.Base(file))
-		if err := m.k8sClient.Apply(ctx, file); err != nil {
-			return fmt.Errorf("failed to apply manifest %s: %v", file, err)
-		}
+// applyFile applies a single manifest file
+func (m *ManifestApplier) applyFile(ctx context.Context, file string) error {
+	log.Printf("Applying manifest: %s", filepath.Base(file))
+	if err := m.k8sClient.Apply(ctx, file); err != nil {
+		return fmt.Errorf("failed to apply manifest %s: %v", file, err)
 	}
+	return nil
+}
 
-	log.Println("All manifests applied successfully")
+// applyObject applies a single in-memory object
+func (m *ManifestApplier) applyObject(ctx context.Context, obj *unstructured.Unstructured) error {
+	log.Printf("Applying %s: %s", obj.GetKind(), obj.GetName())
+	if err := m.k8sClient.ApplyObject(ctx, obj); err != nil {
+		return fmt.Errorf("failed to apply %s %s: %v", obj.GetKind(), obj.GetName(), err)
+	}
 	return nil
 }
@@ -0,0 +1,229 @@
+package deploy
+
+import (
+	"fmt"
+	"strconv"
+
+	"awx-deployer/internal/config"
+
+	"k8s.io/apimachinery/pkg/apis/meta/v1/unstructured"
+)
+
+// The objects below are built directly from the configuration and sent to the
+// API server as-is, so they are never rendered to or parsed from YAML.
+
+// namespaceObject returns the namespace everything else is deployed into
+func namespaceObject(cfg *config.Config) *unstructured.Unstructured {
+	return &unstructured.Unstructured{Object: map[string]interface{}{
+		"apiVersion": "v1",
+		"kind":       "Namespace",
+		"metadata": map[string]interface{}{
+			"name": cfg.Namespace,
+			"labels": map[string]interface{}{
+				"name": cfg.Namespace,
+			},
+		},
+	}}
+}
+
+// storageClassObject returns the hostPath storage class used by the volumes
+func storageClassObject(cfg *config.Config) *unstructured.Unstructured {
+	return &unstructured.Unstructured{Object: map[string]interface{}{
+		"apiVersion": "storage.k8s.io/v1",
+		"kind":       "StorageClass",
+		"metadata": map[string]interface{}{
+			"name": cfg.StorageClass,
+		},
+		"provisioner":          "kubernetes.io/no-provisioner",
+		"volumeBindingMode":    "WaitForFirstConsumer",
+		"allowVolumeExpansion": true,
+	}}
+}
+
+// persistentVolumeObject returns a hostPath persistent volume
+func persistentVolumeObject(cfg *config.Config, name, path, size string) *unstructured.Unstructured {
+	return &unstructured.Unstructured{Object: map[string]interface{}{
+		"apiVersion": "v1",
+		"kind":       "PersistentVolume",
+		"metadata": map[string]interface{}{
+			"name": name,
+		},
+		"spec": map[string]interface{}{
+			"capacity": map[string]interface{}{
+				"storage": size,
+			},
+			"accessModes":                   []interface{}{"ReadWriteOnce"},
+			"persistentVolumeReclaimPolicy": "Retain",
+			"storageClassName":              cfg.StorageClass,
+			"hostPath": map[string]interface{}{
+				"path": path,
+				"type": "DirectoryOrCreate",
+			},
+		},
+	}}
+}
+
+// secretObject returns an opaque secret holding the given string values
+func secretObject(cfg *config.Config, name string, data map[string]interface{}) *unstructured.Unstructured {
+	return &unstructured.Unstructured{Object: map[string]interface{}{
+		"apiVersion": "v1",
+		"kind":       "Secret",
+		"metadata": map[string]interface{}{
+			"name":      name,
+			"namespace": cfg.Namespace,
+		},
+		"type":       "Opaque",
+		"stringData": data,
+	}}
+}
+
+// fixPermissionsScript prepares the hostPath directories for the PostgreSQL
+// (uid 26) and AWX (uid 1000) containers
+const fixPermissionsScript = `echo "Creating AWX directories and setting permissions..."
+mkdir -p /var/lib/pgsql/data/userdata /opt/awx/projects
+chown -R 26:26 /var/lib/pgsql/data/userdata
+chown -R 1000:1000 /opt/awx/projects
+chmod 755 /var/lib/pgsql/data/userdata /opt/awx/projects
+echo "Permissions fixed successfully"
+ls -la /var/lib/pgsql/data/
+`
+
+// fixPermissionsJobObject returns the job that fixes ownership of the hostPath directories
+func fixPermissionsJobObject(cfg *config.Config) *unstructured.Unstructured {
+	return &unstructured.Unstructured{Object: map[string]interface{}{
+		"apiVersion": "batch/v1",
+		"kind":       "Job",
+		"metadata": map[string]interface{}{
+			"name":      "awx-fix-permissions",
+			"namespace": cfg.Namespace,
+		},
+		"spec": map[string]interface{}{
+			"template": map[string]interface{}{
+				"metadata": map[string]interface{}{
+					"name": "awx-fix-permissions",
+				},
+				"spec": map[string]interface{}{
+					"restartPolicy": "OnFailure",
+					"securityContext": map[string]interface{}{
+						"runAsUser":  int64(0),
+						"runAsGroup": int64(0),
+					},
+					"containers": []interface{}{
+						map[string]interface{}{
+							"name":  "fix-permissions",
+							"image": "busybox:1.35",
+							"securityContext": map[string]interface{}{
+								"runAsUser":  int64(0),
+								"runAsGroup": int64(0),
+								"privileged": true,
+							},
+							"command": []interface{}{"/bin/sh", "-c", fixPermissionsScript},
+							"volumeMounts": []interface{}{
+								map[string]interface{}{
+									"name":      "postgres-data",
+									"mountPath": "/var/lib/pgsql/data/userdata",
+								},
+								map[string]interface{}{
+									"name":      "projects-data",
+									"mountPath": "/opt/awx/projects",
+								},
+							},
+						},
+					},
+					"volumes": []interface{}{
+						map[string]interface{}{
+							"name": "postgres-data",
+							"hostPath": map[string]interface{}{
+								"path": "/var/lib/pgsql/data/userdata",
+								"type": "DirectoryOrCreate",
+							},
+						},
+						map[string]interface{}{
+							"name": "projects-data",
+							"hostPath": map[string]interface{}{
+								"path": "/opt/awx/projects",
+								"type": "DirectoryOrCreate",
+							},
+						},
+					},
+				},
+			},
+		},
+	}}
+}
+
+// prerequisiteObjects returns everything the AWX instance depends on
+func prerequisiteObjects(cfg *config.Config) []*unstructured.Unstructured {
+	return []*unstructured.Unstructured{
+		fixPermissionsJobObject(cfg),
+		storageClassObject(cfg),
+		persistentVolumeObject(cfg, "awx-postgres-pv", "/opt/awx/postgres", cfg.PostgresStorage),
+		persistentVolumeObject(cfg, "awx-projects-pv", "/opt/awx/projects", cfg.ProjectsStorage),
+		secretObject(cfg, "awx-postgres-configuration", map[string]interface{}{
+			"host":     cfg.PostgresHost,
+			"port":     strconv.Itoa(cfg.PostgresPort),
+			"database": cfg.PostgresDatabase,
+			"username": cfg.PostgresUsername,
+			"password": cfg.PostgresPassword,
+			"type":     "managed",
+		}),
+		secretObject(cfg, "awx-admin-password", map[string]interface{}{
+			"password": cfg.AdminPassword,
+		}),
+	}
+}
+
+// awxInstanceObject returns the AWX custom resource reconciled by the operator
+func awxInstanceObject(cfg *config.Config) *unstructured.Unstructured {
+	ingressAnnotations := fmt.Sprintf(`cert-manager.io/cluster-issuer: %q
+nginx.ingress.kubernetes.io/ssl-redirect: "true"
+nginx.ingress.kubernetes.io/force-ssl-redirect: "true"
+`, cfg.CertIssuer)
+
+	return &unstructured.Unstructured{Object: map[string]interface{}{
+		"apiVersion": "awx.ansible.com/v1beta1",
+		"kind":       "AWX",
+		"metadata": map[string]interface{}{
+			"name":      cfg.AWXName,
+			"namespace": cfg.Namespace,
+		},
+		"spec": map[string]interface{}{
+			"service_type":        "ClusterIP",
+			"hostname":            cfg.AWXHostname,
+			"ingress_type":        "ingress",
+			"ingress_class_name":  cfg.IngressClassName,
+			"ingress_annotations": ingressAnnotations,
+			"ingress_tls_secret":  cfg.TLSSecretName,
+
+			// PostgreSQL configuration
+			"postgres_storage_class": cfg.StorageClass,
+			"postgres_storage_requirements": map[string]interface{}{
+				"requests": map[string]interface{}{
+					"storage": cfg.PostgresStorage,
+				},
+			},
+			"postgres_configuration_secret": "awx-postgres-configuration",
+
+			// Projects persistence
+			"projects_persistence":   true,
+			"projects_storage_class": cfg.StorageClass,
+			"projects_storage_size":  cfg.ProjectsStorage,
+
+			// Admin configuration
+			"admin_user":            cfg.AdminUser,
+			"admin_password_secret": "awx-admin-password",
+
+			// Additional PostgreSQL configuration
+			"postgres_resource_requirements": map[string]interface{}{
+				"requests": map[string]interface{}{
+					"cpu":    "0.5",
+					"memory": "2Gi",
+				},
+				"limits": map[string]interface{}{
+					"cpu":    "1",
+					"memory": "4Gi",
+				},
+			},
+		},
+	}}
+}
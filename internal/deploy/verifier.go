@@ -5,6 +5,7 @@ import (
 	"fmt"
 	"log"
 	"strings"
+	"sync"
 
 	"awx-deployer/internal/config"
 	"awx-deployer/internal/k8s"
@@ -14,6 +15,12 @@ import (
 type DeploymentVerifier struct {
 	k8sClient *k8s.KubernetesClient
 	config    *config.Config
+
+	// Cluster state read once, concurrently, at the start of Verify
+	awxInstanceExists bool
+	postgresExists    bool
+	deployments       map[string]bool
+	services          map[string]bool
 }
 
 // NewDeploymentVerifier creates a new deployment verifier
@@ -28,6 +35,10 @@ func NewDeploymentVerifier(k8sClient *k8s.KubernetesClient, config *config.Confi
 func (v *DeploymentVerifier) Verify(ctx context.Context) error {
 	log.Println("Verifying AWX deployment...")
 
+	if err := v.loadClusterState(ctx); err != nil {
+		return err
+	}
+
 	// Verify AWX instance exists
 	if err := v.verifyAWXInstance(ctx); err != nil {
 		return fmt.Errorf("AWX instance verification failed: %v", err)
@@ -63,14 +74,55 @@ func (v *DeploymentVerifier) Verify(ctx context.Context) error {
 	return nil
 }
 
-// verifyAWXInstance verifies the AWX custom resource exists
-func (v *DeploymentVerifier) verifyAWXInstance(ctx context.Context) error {
-	exists, err := v.k8sClient.ResourceExists(ctx, "awx.ansible.com", "v1beta1", "awxs", v.config.AWXName, v.config.Namespace)
-	if err != nil {
-		return fmt.Errorf("failed to check AWX instance: %v", err)
+// loadClusterState reads everything the checks below need. Each kind is
+// listed once rather than fetched per object, and the reads are independent
+// so they run concurrently.
+func (v *DeploymentVerifier) loadClusterState(ctx context.Context) error {
+	var wg sync.WaitGroup
+	var instanceErr, postgresErr, deploymentsErr, servicesErr error
+
+	wg.Add(4)
+	go func() {
+		defer wg.Done()
+		v.awxInstanceExists, instanceErr = v.k8sClient.ResourceExists(ctx, "awx.ansible.com", "v1beta1", "awxs", v.config.AWXName, v.config.Namespace)
+	}()
+	go func() {
+		defer wg.Done()
+		v.postgresExists, postgresErr = v.k8sClient.ResourceExists(ctx, "apps", "v1", "statefulsets", v.postgresStatefulSet(), v.config.Namespace)
+	}()
+	go func() {
+		defer wg.Done()
+		v.deployments, deploymentsErr = v.k8sClient.ListResourceNames(ctx, "apps", "v1", "deployments", v.config.Namespace)
+	}()
+	go func() {
+		defer wg.Done()
+		v.services, servicesErr = v.k8sClient.ListResourceNames(ctx, "", "v1", "services", v.config.Namespace)
+	}()
+	wg.Wait()
+
+	if instanceErr != nil {
+		return fmt.Errorf("failed to check AWX instance: %v", instanceErr)
+	}
+	if postgresErr != nil {
+		return fmt.Errorf("failed to check PostgreSQL statefulset: %v", postgresErr)
+	}
+	if deploymentsErr != nil {
+		return fmt.Errorf("failed to list deployments: %v", deploymentsErr)
+	}
+	if servicesErr != nil {
+		return fmt.Errorf("failed to list services: %v", servicesErr)
 	}
+	return nil
+}
 
-	if !exists {
+// postgresStatefulSet returns the name of the operator-managed PostgreSQL statefulset
+func (v *DeploymentVerifier) postgresStatefulSet() string {
+	return fmt.Sprintf("%s-postgres-15", v.config.AWXName)
+}
+
+// verifyAWXInstance verifies the AWX custom resource exists
+func (v *DeploymentVerifier) verifyAWXInstance(ctx context.Context) error {
+	if !v.awxInstanceExists {
 		return fmt.Errorf("AWX instance %s does not exist", v.config.AWXName)
 	}
 
@@ -78,17 +130,11 @@ func (v *DeploymentVerifier) verifyAWXInstance(ctx context.Context) error {
 	return nil
 }
 
-// verifyPostgreSQL verifies PostgreSQL deployment and pods
+// verifyPostgreSQL verifies the PostgreSQL statefulset and pods
 func (v *DeploymentVerifier) verifyPostgreSQL(ctx context.Context) error {
-	// Check PostgreSQL deployment
-	postgresDeployment := fmt.Sprintf("%s-postgres-15", v.config.AWXName)
-	exists, err := v.k8sClient.ResourceExists(ctx, "apps", "v1", "deployments", postgresDeployment, v.config.Namespace)
-	if err != nil {
-		return fmt.Errorf("failed to check PostgreSQL deployment: %v", err)
-	}
-
-	if !exists {
-		return fmt.Errorf("PostgreSQL deployment %s does not exist", postgresDeployment)
+	// Check PostgreSQL statefulset
+	if !v.postgresExists {
+		return fmt.Errorf("PostgreSQL statefulset %s does not exist", v.postgresStatefulSet())
 	}
 
 	// Check PostgreSQL pod status
@@ -110,12 +156,7 @@ func (v *DeploymentVerifier) verifyPostgreSQL(ctx context.Context) error {
 func (v *DeploymentVerifier) verifyAWXWeb(ctx context.Context) error {
 	// Check AWX web deployment
 	webDeployment := fmt.Sprintf("%s-web", v.config.AWXName)
-	exists, err := v.k8sClient.ResourceExists(ctx, "apps", "v1", "deployments", webDeployment, v.config.Namespace)
-	if err != nil {
-		return fmt.Errorf("failed to check AWX web deployment: %v", err)
-	}
-
-	if !exists {
+	if !v.deployments[webDeployment] {
 		return fmt.Errorf("AWX web deployment %s does not exist", webDeployment)
 	}
 
@@ -138,12 +179,7 @@ func (v *DeploymentVerifier) verifyAWXWeb(ctx context.Context) error {
 func (v *DeploymentVerifier) verifyAWXTask(ctx context.Context) error {
 	// Check AWX task deployment
 	taskDeployment := fmt.Sprintf("%s-task", v.config.AWXName)
-	exists, err := v.k8sClient.ResourceExists(ctx, "apps", "v1", "deployments", taskDeployment, v.config.Namespace)
-	if err != nil {
-		return fmt.Errorf("failed to check AWX task deployment: %v", err)
-	}
-
-	if !exists {
+	if !v.deployments[taskDeployment] {
 		return fmt.Errorf("AWX task deployment %s does not exist", taskDeployment)
 	}
 
@@ -170,12 +206,7 @@ func (v *DeploymentVerifier) verifyServices(ctx context.Context) error {
 	}
 
 	for _, service := range services {
-		exists, err := v.k8sClient.ResourceExists(ctx, "", "v1", "services", service, v.config.Namespace)
-		if err != nil {
-			return fmt.Errorf("failed to check service %s: %v", service, err)
-		}
-
-		if !exists {
+		if !v.services[service] {
 			return fmt.Errorf("service %s does not exist", service)
 		}
 		log.Printf("✓ Service %s exists", service)
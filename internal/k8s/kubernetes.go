@@ -1,29 +1,40 @@
 package k8s
 
 import (
+	"bytes"
 	"context"
 	"fmt"
+	"io"
 	"io/ioutil"
+	"log"
 	"time"
 
 	appsv1 "k8s.io/api/apps/v1"
 	"k8s.io/apimachinery/pkg/api/errors"
+	"k8s.io/apimachinery/pkg/api/meta"
 	metav1 "k8s.io/apimachinery/pkg/apis/meta/v1"
 	"k8s.io/apimachinery/pkg/apis/meta/v1/unstructured"
+	"k8s.io/apimachinery/pkg/runtime"
 	"k8s.io/apimachinery/pkg/runtime/schema"
-	"k8s.io/apimachinery/pkg/runtime/serializer/yaml"
+	"k8s.io/apimachinery/pkg/util/wait"
+	utilyaml "k8s.io/apimachinery/pkg/util/yaml"
+	"k8s.io/apimachinery/pkg/watch"
 	"k8s.io/client-go/discovery"
+	"k8s.io/client-go/discovery/cached/memory"
 	"k8s.io/client-go/dynamic"
 	"k8s.io/client-go/kubernetes"
+	"k8s.io/client-go/metadata"
 	"k8s.io/client-go/rest"
+	"k8s.io/client-go/restmapper"
 	"k8s.io/client-go/tools/clientcmd"
 )
 
 // KubernetesClient handles all Kubernetes operations using client-go
 type KubernetesClient struct {
-	clientset       kubernetes.Interface
-	dynamicClient   dynamic.Interface
-	discoveryClient *discovery.DiscoveryClient
+	clientset      kubernetes.Interface
+	dynamicClient  dynamic.Interface
+	metadataClient metadata.Interface
+	restMapper     *restmapper.DeferredDiscoveryRESTMapper
 }
 
 // NewKubernetesClient creates a new Kubernetes client using client-go
@@ -43,164 +54,320 @@ func NewKubernetesClient(kubeconfigPath string) (*KubernetesClient, error) {
 		}
 	}
 
-	clientset, err := kubernetes.NewForConfig(config)
+	// Built-in types can be served as protobuf, which is much cheaper to decode
+	// than JSON; custom resources can't, so the dynamic client stays on JSON
+	protoConfig := rest.CopyConfig(config)
+	protoConfig.AcceptContentTypes = runtime.ContentTypeProtobuf + "," + runtime.ContentTypeJSON
+	protoConfig.ContentType = runtime.ContentTypeProtobuf
+
+	// The kubeconfig is loaded once above; every API client shares one HTTP
+	// client, and with it one connection pool and one set of cached credentials
+	httpClient, err := rest.HTTPClientFor(config)
+	if err != nil {
+		return nil, fmt.Errorf("failed to create HTTP client: %v", err)
+	}
+
+	clientset, err := kubernetes.NewForConfigAndClient(protoConfig, httpClient)
 	if err != nil {
 		return nil, fmt.Errorf("failed to create clientset: %v", err)
 	}
 
-	dynamicClient, err := dynamic.NewForConfig(config)
+	dynamicClient, err := dynamic.NewForConfigAndClient(config, httpClient)
 	if err != nil {
 		return nil, fmt.Errorf("failed to create dynamic client: %v", err)
 	}
 
-	discoveryClient, err := discovery.NewDiscoveryClientForConfig(config)
+	metadataClient, err := metadata.NewForConfigAndClient(config, httpClient)
+	if err != nil {
+		return nil, fmt.Errorf("failed to create metadata client: %v", err)
+	}
+
+	discoveryClient, err := discovery.NewDiscoveryClientForConfigAndClient(config, httpClient)
 	if err != nil {
 		return nil, fmt.Errorf("failed to create discovery client: %v", err)
 	}
 
+	// Discovery results are cached in memory; ApplyObject resets the cache when
+	// a kind isn't found, e.g. after the operator registers its CRDs
+	restMapper := restmapper.NewDeferredDiscoveryRESTMapper(memory.NewMemCacheClient(discoveryClient))
+
 	return &KubernetesClient{
-		clientset:       clientset,
-		dynamicClient:   dynamicClient,
-		discoveryClient: discoveryClient,
+		clientset:      clientset,
+		dynamicClient:  dynamicClient,
+		metadataClient: metadataClient,
+		restMapper:     restMapper,
 	}, nil
 }
 
-// Apply applies a YAML manifest file
+// fieldManager identifies this deployer as the owner of fields it applies
+const fieldManager = "awx-deployer"
+
+// Apply applies every object in a YAML manifest file, which may contain
+// multiple "---"-separated documents
 func (k *KubernetesClient) Apply(ctx context.Context, manifestPath string) error {
 	manifestData, err := ioutil.ReadFile(manifestPath)
 	if err != nil {
 		return fmt.Errorf("failed to read manifest file %s: %v", manifestPath, err)
 	}
 
-	decoder := yaml.NewDecodingSerializer(unstructured.UnstructuredJSONScheme)
-	obj := &unstructured.Unstructured{}
-	_, gvk, err := decoder.Decode(manifestData, nil, obj)
-	if err != nil {
-		return fmt.Errorf("failed to decode manifest %s: %v", manifestPath, err)
+	decoder := utilyaml.NewYAMLOrJSONDecoder(bytes.NewReader(manifestData), 4096)
+	for {
+		var raw map[string]interface{}
+		if err := decoder.Decode(&raw); err != nil {
+			if err == io.EOF {
+				return nil
+			}
+			return fmt.Errorf("failed to decode manifest %s: %v", manifestPath, err)
+		}
+
+		// Skip empty or comment-only documents
+		if len(raw) == 0 {
+			continue
+		}
+
+		if err := k.ApplyObject(ctx, &unstructured.Unstructured{Object: raw}); err != nil {
+			return err
+		}
 	}
+}
 
-	gvr, err := k.gvrForGVK(gvk)
+// ApplyObject server-side applies an object, creating or updating it in a single request
+func (k *KubernetesClient) ApplyObject(ctx context.Context, obj *unstructured.Unstructured) error {
+	gvk := obj.GroupVersionKind()
+	mapping, err := k.restMapper.RESTMapping(gvk.GroupKind(), gvk.Version)
+	if meta.IsNoMatchError(err) {
+		// The cached discovery counts as fresh once filled, so kinds registered
+		// since then (such as the AWX CRD) are only seen after a reset
+		k.restMapper.Reset()
+		mapping, err = k.restMapper.RESTMapping(gvk.GroupKind(), gvk.Version)
+	}
 	if err != nil {
-		return fmt.Errorf("failed to get GVR for GVK %s: %v", gvk.String(), err)
+		return fmt.Errorf("failed to get REST mapping for GVK %s: %v", gvk.String(), err)
 	}
 
-	namespace := obj.GetNamespace()
-	if namespace == "" {
-		// some resources are cluster-wide and don't have a namespace
-		if gvr.Resource != "namespaces" && gvr.Resource != "persistentvolumes" {
+	var resource dynamic.ResourceInterface
+	if mapping.Scope.Name() == meta.RESTScopeNameNamespace {
+		namespace := obj.GetNamespace()
+		if namespace == "" {
 			namespace = "default"
 		}
-	}
-
-	var resource dynamic.ResourceInterface
-	if namespace != "" {
-		resource = k.dynamicClient.Resource(gvr).Namespace(namespace)
+		resource = k.dynamicClient.Resource(mapping.Resource).Namespace(namespace)
 	} else {
-		resource = k.dynamicClient.Resource(gvr)
+		// cluster-wide resources don't have a namespace
+		resource = k.dynamicClient.Resource(mapping.Resource)
 	}
 
-	_, createErr := resource.Create(ctx, obj, metav1.CreateOptions{})
-	if createErr != nil {
-		if errors.IsAlreadyExists(createErr) {
-			existingObj, getErr := resource.Get(ctx, obj.GetName(), metav1.GetOptions{})
-			if getErr != nil {
-				return fmt.Errorf("failed to get existing resource %s: %v", obj.GetName(), getErr)
-			}
-			obj.SetResourceVersion(existingObj.GetResourceVersion())
-			_, updateErr := resource.Update(ctx, obj, metav1.UpdateOptions{})
-			if updateErr != nil {
-				return fmt.Errorf("failed to update resource %s: %v", obj.GetName(), updateErr)
-			}
-			return nil
-		}
-		return fmt.Errorf("failed to create resource %s: %v", obj.GetName(), createErr)
+	// Server-side apply is idempotent, so no existence check or update retry is needed
+	_, err = resource.Apply(ctx, obj.GetName(), obj, metav1.ApplyOptions{FieldManager: fieldManager, Force: true})
+	if err != nil {
+		return fmt.Errorf("failed to apply resource %s: %v", obj.GetName(), err)
 	}
 
 	return nil
 }
 
-func (k *KubernetesClient) gvrForGVK(gvk *schema.GroupVersionKind) (schema.GroupVersionResource, error) {
-	apiResourceList, err := k.discoveryClient.ServerResourcesForGroupVersion(gvk.GroupVersion().String())
+// ResourceExists checks if a Kubernetes resource exists
+func (k *KubernetesClient) ResourceExists(ctx context.Context, group, version, resource, name, namespace string) (bool, error) {
+	_, err := k.metadataResource(group, version, resource, namespace).Get(ctx, name, metav1.GetOptions{})
 	if err != nil {
-		return schema.GroupVersionResource{}, err
+		if errors.IsNotFound(err) {
+			return false, nil
+		}
+		return false, fmt.Errorf("failed to get resource %s/%s: %v", resource, name, err)
 	}
+	return true, nil
+}
 
-	for _, apiResource := range apiResourceList.APIResources {
-		if apiResource.Kind == gvk.Kind {
-			return schema.GroupVersionResource{
-				Group:    gvk.Group,
-				Version:  gvk.Version,
-				Resource: apiResource.Name,
-			}, nil
-		}
+// ListResourceNames returns the names of all resources of a kind with a single LIST call
+func (k *KubernetesClient) ListResourceNames(ctx context.Context, group, version, resource, namespace string) (map[string]bool, error) {
+	list, err := k.metadataResource(group, version, resource, namespace).List(ctx, metav1.ListOptions{})
+	if err != nil {
+		return nil, fmt.Errorf("failed to list %s: %v", resource, err)
 	}
 
-	return schema.GroupVersionResource{}, fmt.Errorf("resource not found for GVK %s", gvk.String())
+	names := make(map[string]bool, len(list.Items))
+	for _, item := range list.Items {
+		names[item.GetName()] = true
+	}
+	return names, nil
 }
 
-// ApplyKustomize is deprecated and will be removed.
-func (k *KubernetesClient) ApplyKustomize(ctx context.Context, kustomizeURL string) error {
-	return fmt.Errorf("ApplyKustomize is deprecated")
+// metadataResource returns a client that fetches only object metadata, so
+// existence checks don't transfer full specs and statuses
+func (k *KubernetesClient) metadataResource(group, version, resource, namespace string) metadata.ResourceInterface {
+	gvr := schema.GroupVersionResource{Group: group, Version: version, Resource: resource}
+	if namespace != "" {
+		return k.metadataClient.Resource(gvr).Namespace(namespace)
+	}
+	return k.metadataClient.Resource(gvr)
 }
 
-// ResourceExists checks if a Kubernetes resource exists
-func (k *KubernetesClient) ResourceExists(ctx context.Context, group, version, resource, name, namespace string) (bool, error) {
+// WaitForDeployment waits for a deployment to report the Available condition
+func (k *KubernetesClient) WaitForDeployment(ctx context.Context, deploymentName, namespace string) error {
+	newWatch := func(ctx context.Context) (watch.Interface, error) {
+		return k.clientset.AppsV1().Deployments(namespace).Watch(ctx, watchOptions(ctx, deploymentName))
+	}
+
+	return watchUntil(ctx, "deployment "+deploymentName, newWatch, func(obj runtime.Object) bool {
+		deployment, ok := obj.(*appsv1.Deployment)
+		if !ok {
+			return false
+		}
+		for _, cond := range deployment.Status.Conditions {
+			if cond.Type == appsv1.DeploymentAvailable && cond.Status == "True" {
+				return true
+			}
+		}
+		return false
+	})
+}
+
+// WaitForStatefulSet waits for all replicas of a statefulset to be ready
+func (k *KubernetesClient) WaitForStatefulSet(ctx context.Context, statefulSetName, namespace string) error {
+	newWatch := func(ctx context.Context) (watch.Interface, error) {
+		return k.clientset.AppsV1().StatefulSets(namespace).Watch(ctx, watchOptions(ctx, statefulSetName))
+	}
+
+	return watchUntil(ctx, "statefulset "+statefulSetName, newWatch, func(obj runtime.Object) bool {
+		statefulSet, ok := obj.(*appsv1.StatefulSet)
+		if !ok {
+			return false
+		}
+		replicas := int32(1)
+		if statefulSet.Spec.Replicas != nil {
+			replicas = *statefulSet.Spec.Replicas
+		}
+		return statefulSet.Status.ObservedGeneration >= statefulSet.Generation && statefulSet.Status.ReadyReplicas >= replicas
+	})
+}
+
+// WaitForCondition waits for a resource to report the given status condition as "True"
+func (k *KubernetesClient) WaitForCondition(ctx context.Context, group, version, resource, name, namespace, conditionType string) error {
 	gvr := schema.GroupVersionResource{Group: group, Version: version, Resource: resource}
-	var err error
-	if namespace != "" {
-		_, err = k.dynamicClient.Resource(gvr).Namespace(namespace).Get(ctx, name, metav1.GetOptions{})
-	} else {
-		_, err = k.dynamicClient.Resource(gvr).Get(ctx, name, metav1.GetOptions{})
+	newWatch := func(ctx context.Context) (watch.Interface, error) {
+		return k.dynamicClient.Resource(gvr).Namespace(namespace).Watch(ctx, watchOptions(ctx, name))
 	}
 
-	if err != nil {
-		if errors.IsNotFound(err) {
-			return false, nil
+	return watchUntil(ctx, resource+"/"+name, newWatch, func(obj runtime.Object) bool {
+		u, ok := obj.(*unstructured.Unstructured)
+		if !ok {
+			return false
+		}
+		conditions, _, _ := unstructured.NestedSlice(u.Object, "status", "conditions")
+		for _, c := range conditions {
+			cond, ok := c.(map[string]interface{})
+			if ok && cond["type"] == conditionType && cond["status"] == "True" {
+				return true
+			}
+		}
+		return false
+	})
+}
+
+// watchUntil consumes watch events until done reports true or ctx is done.
+// Watches that fail to start (e.g. a CRD not registered yet) or that the
+// server closes are re-established with jittered exponential backoff.
+// Progress is logged once a minute while waiting.
+func watchUntil(ctx context.Context, what string, newWatch func(context.Context) (watch.Interface, error), done func(runtime.Object) bool) error {
+	backoff := watchBackoff()
+	stopProgress := logProgress(what, time.Minute)
+	defer stopProgress()
+
+	for {
+		watcher, err := newWatch(ctx)
+		if err != nil {
+			if ctx.Err() == nil {
+				log.Printf("Warning: Could not watch %s: %v", what, err)
+			}
+		} else {
+			ready, sawEvent, err := consumeWatch(ctx, watcher, done)
+			if ready {
+				return nil
+			}
+			if sawEvent {
+				// The watch worked, so only consecutive failures back off
+				backoff = watchBackoff()
+			}
+			if err != nil && ctx.Err() == nil {
+				log.Printf("Warning: Watch for %s failed: %v", what, err)
+			}
+		}
+
+		select {
+		case <-ctx.Done():
+			return fmt.Errorf("context cancelled waiting for %s to be ready", what)
+		case <-time.After(backoff.Step()):
 		}
-		return false, fmt.Errorf("failed to get resource %s/%s: %v", resource, name, err)
 	}
-	return true, nil
 }
 
-// WaitForDeployment waits for a deployment to be ready
-func (k *KubernetesClient) WaitForDeployment(ctx context.Context, deploymentName, namespace string) error {
-	watcher, err := k.clientset.AppsV1().Deployments(namespace).Watch(ctx, metav1.ListOptions{FieldSelector: "metadata.name=" + deploymentName})
-	if err != nil {
-		return fmt.Errorf("failed to watch deployment: %v", err)
+// watchBackoff returns the delay schedule for re-establishing a watch
+func watchBackoff() wait.Backoff {
+	return wait.Backoff{Duration: 500 * time.Millisecond, Factor: 2, Jitter: 0.5, Steps: 10, Cap: 10 * time.Second}
+}
+
+// watchOptions selects a single object by name and, when ctx has a deadline,
+// asks the server to end the watch at that deadline
+func watchOptions(ctx context.Context, name string) metav1.ListOptions {
+	opts := metav1.ListOptions{FieldSelector: "metadata.name=" + name}
+	if deadline, ok := ctx.Deadline(); ok {
+		seconds := int64(time.Until(deadline).Seconds()) + 1
+		opts.TimeoutSeconds = &seconds
 	}
-	defer watcher.Stop()
+	return opts
+}
+
+// logProgress logs a "still waiting" line every interval until the returned stop func is called
+func logProgress(what string, interval time.Duration) func() {
+	start := time.Now()
+	ticker := time.NewTicker(interval)
+	done := make(chan struct{})
+
+	go func() {
+		for {
+			select {
+			case <-ticker.C:
+				log.Printf("Still waiting for %s (%v elapsed)...", what, time.Since(start).Round(time.Second))
+			case <-done:
+				return
+			}
+		}
+	}()
 
-	ch := watcher.ResultChan()
-	timeout := time.After(15 * time.Minute) // 15 minute timeout, configurable?
+	return func() {
+		ticker.Stop()
+		close(done)
+	}
+}
+
+// consumeWatch reads events until done reports true, the watch closes or ctx
+// is done. It also reports whether any event was received.
+func consumeWatch(ctx context.Context, watcher watch.Interface, done func(runtime.Object) bool) (ready, sawEvent bool, err error) {
+	defer watcher.Stop()
 
 	for {
 		select {
-		case event, ok := <-ch:
+		case event, ok := <-watcher.ResultChan():
 			if !ok {
-				// Channel closed, something went wrong.
-				return fmt.Errorf("watcher channel closed for deployment %s", deploymentName)
+				return false, sawEvent, nil
 			}
-			deployment, ok := event.Object.(*appsv1.Deployment)
-			if !ok {
-				continue
+			if event.Type == watch.Error {
+				return false, sawEvent, errors.FromObject(event.Object)
 			}
-
-			for _, cond := range deployment.Status.Conditions {
-				if cond.Type == appsv1.DeploymentAvailable && cond.Status == "True" {
-					return nil
-				}
+			sawEvent = true
+			if done(event.Object) {
+				return true, sawEvent, nil
 			}
-		case <-timeout:
-			return fmt.Errorf("timeout waiting for deployment %s to be ready", deploymentName)
 		case <-ctx.Done():
-			return fmt.Errorf("context cancelled waiting for deployment to be ready")
+			return false, sawEvent, ctx.Err()
 		}
 	}
 }
 
 // GetPodStatus gets the status of pods with a given label selector
 func (k *KubernetesClient) GetPodStatus(ctx context.Context, labelSelector, namespace string) (string, error) {
-	pods, err := k.clientset.CoreV1().Pods(namespace).List(ctx, metav1.ListOptions{LabelSelector: labelSelector})
+	// Only the first pod is inspected, so don't fetch the rest
+	pods, err := k.clientset.CoreV1().Pods(namespace).List(ctx, metav1.ListOptions{LabelSelector: labelSelector, Limit: 1})
 	if err != nil {
 		return "", fmt.Errorf("failed to list pods: %v", err)
 	}
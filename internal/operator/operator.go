@@ -28,18 +28,8 @@ func NewOperatorInstaller(k8sClient *k8s.KubernetesClient, config *config.Config
 func (o *OperatorInstaller) Install(ctx context.Context) error {
 	log.Println("Installing AWX Operator...")
 
-	// Check if operator is already installed
-	exists, err := o.k8sClient.ResourceExists(ctx, "apps", "v1", "deployments", "awx-operator-controller-manager", o.config.Namespace)
-	if err != nil {
-		return fmt.Errorf("failed to check if operator exists: %v", err)
-	}
-
-	if exists {
-		log.Println("AWX Operator already installed, skipping installation")
-		return nil
-	}
-
-	// Install operator using the manifest file
+	// Server-side apply is idempotent, so re-running against an existing
+	// install needs no separate existence check
 	log.Printf("Installing AWX Operator from manifest...")
 	manifestPath := "manifests/awx-operator.yaml"
 	if err := o.k8sClient.Apply(ctx, manifestPath); err != nil {
@@ -63,32 +53,11 @@ func (o *OperatorInstaller) waitForOperatorReady(ctx context.Context) error {
 	ctxWithTimeout, cancel := context.WithTimeout(ctx, timeout)
 	defer cancel()
 
-	// Wait for the deployment to be ready
+	// The Available condition already implies the operator pods are up
 	if err := o.k8sClient.WaitForDeployment(ctxWithTimeout, "awx-operator-controller-manager", o.config.Namespace); err != nil {
 		return fmt.Errorf("operator deployment not ready: %v", err)
 	}
 
-	// Additional check to ensure operator pods are running
-	ticker := time.NewTicker(10 * time.Second)
-	defer ticker.Stop()
-
-	for {
-		select {
-		case <-ctxWithTimeout.Done():
-			return fmt.Errorf("timeout waiting for operator pods to be ready")
-		case <-ticker.C:
-			status, err := o.k8sClient.GetPodStatus(ctxWithTimeout, "control-plane=controller-manager", o.config.Namespace)
-			if err != nil {
-				log.Printf("Warning: Could not get operator pod status: %v", err)
-				continue
-			}
-
-			if status == "Running" {
-				log.Println("Operator pods are running")
-				return nil
-			}
-
-			log.Printf("Operator pod status: %s, waiting...", status)
-		}
-	}
+	log.Println("Operator pods are running")
+	return nil
 }